@@ -1,33 +1,49 @@
 # main.py - corrected & debugged
 # sanitize provider responses before returning to client
 
-from fastapi import FastAPI, File, UploadFile, Depends, HTTPException, Body, Query
+from fastapi import FastAPI, File, UploadFile, Depends, HTTPException, Body, Query, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, ORJSONResponse
+from pydantic import BaseModel, field_validator
 
+import asyncio
+import atexit
 import os
+import queue
 import tempfile
 import logging
+import logging.handlers
 import json
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 import signal
 import sys
-from typing import Optional, Any, Dict
+from contextlib import asynccontextmanager
+from typing import Optional, Any, Dict, List, Tuple
 
+import orjson
+from anyio import to_thread
 from dotenv import load_dotenv
 load_dotenv()
 
-# SQLAlchemy Session typing for Depends
-from sqlalchemy.orm import Session
-
-# app logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+# SQLAlchemy AsyncSession typing for Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# app logging: handlers only enqueue records; a listener thread does the (blocking) stream I/O
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))  # only merge args; the listener formats
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("minutes")
 
 # --- Project imports (adapt paths if your layout differs) ---
-from models import get_db, Transcription
+from models import get_db, init_db, close_db, SessionLocal, Transcription, STATUS_PROCESSING, STATUS_COMPLETED, STATUS_FAILED
 
 # services must implement the functions used below.
 from services import (
@@ -38,11 +54,77 @@ from services import (
     save_summary_as_markdown,       # kept for backward compatibility where used
     save_transcript_to_output,     # kept for backward compatibility
     generate_presigned_post,
+    generate_presigned_put,
+    generate_presigned_multipart,
+    warm_s3_connection,
+    complete_multipart_upload,
+    abort_multipart_upload,
+    S3_MAX_MULTIPART_PARTS,
     TRANSFORM_INPUT_BUCKET,
+    TRANSFORM_INPUT_PREFIX,
     OUTPUT_S3_BUCKET,
 )
 
-app = FastAPI(title="minutes API", version="1.0.0")
+# --- Configuration (read from env once at import, never per request) -----
+HOST = os.getenv("HOST", "127.0.0.1")
+PORT = int(os.getenv("PORT", 8000))
+
+# S3 key prefix for presigned uploads
+INPUT_KEY_PREFIX = TRANSFORM_INPUT_PREFIX.rstrip("/")
+
+# read size used when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+# limit upload (configurable via env)
+MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE_BYTES", 100 * 1024 * 1024))  # 100MB default
+# slack for multipart boundaries/headers when comparing against the whole request body
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# max worker threads for blocking ffmpeg/S3/LLM calls (bound to provider rate limits)
+BLOCKING_THREAD_LIMIT = int(os.getenv("BLOCKING_THREAD_LIMIT", "40"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_db()
+    to_thread.current_default_thread_limiter().total_tokens = BLOCKING_THREAD_LIMIT
+    logger.info("Blocking call thread limit set to %d", BLOCKING_THREAD_LIMIT)
+    # warm the shared S3 client in the background so startup isn't blocked on the network
+    warmup = asyncio.create_task(to_thread.run_sync(warm_s3_connection))
+    try:
+        yield
+    finally:
+        warmup.cancel()
+        await close_db()
+
+
+class MaxBodySizeMiddleware:
+    """
+    Reject requests whose declared Content-Length exceeds max_body_size with 413
+    before any of the body is read (FastAPI parses multipart forms before the handler runs).
+    Bodies without Content-Length are still capped by the streaming check in /upload.
+    """
+
+    def __init__(self, app, max_body_size: int):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_body_size:
+                        response = ORJSONResponse(status_code=413, content={"detail": f"File too large. Max {MAX_FILE_SIZE} bytes."})
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+app = FastAPI(title="minutes API", version="1.0.0", lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# added before CORS so 413 responses still carry CORS headers
+app.add_middleware(MaxBodySizeMiddleware, max_body_size=MAX_FILE_SIZE + MULTIPART_OVERHEAD_BYTES)
 
 # CORS (open for dev; tighten in production)
 app.add_middleware(
@@ -54,15 +136,30 @@ app.add_middleware(
 )
 
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_json_native(obj: Any) -> bool:
+    """True if obj is already made of dict/list/str/int/float/bool/None with str keys."""
+    if isinstance(obj, _JSON_SCALARS):
+        return True
+    if isinstance(obj, dict):
+        return all(isinstance(k, str) and _is_json_native(v) for k, v in obj.items())
+    if isinstance(obj, list):
+        return all(_is_json_native(v) for v in obj)
+    return False
+
+
 def _safe(obj: Any) -> Any:
     """
     Return a JSON-serializable version of obj.
-    Strategy: json.dumps with default=str to coerce unknown objects to strings,
-    then json.loads back to Python primitives (dict/list/str/...).
+    Strategy: return already-primitive values unchanged; otherwise round-trip through
+    orjson with default=str to coerce unknown objects to strings.
     """
+    if _is_json_native(obj):
+        return obj
     try:
-        dumped = json.dumps(obj, default=str)
-        return json.loads(dumped)
+        return orjson.loads(orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS))
     except Exception:
         try:
             return str(obj)
@@ -70,58 +167,198 @@ def _safe(obj: Any) -> Any:
             return "(unserializable)"
 
 
+def _input_key(filename: str) -> str:
+    """Timestamped S3 key under the input prefix for a client-supplied filename."""
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    return f"{INPUT_KEY_PREFIX}/{timestamp}_{os.path.basename(filename)}"
+
+
+def _remove_temp_files(*paths: Optional[str]) -> None:
+    for p in paths:
+        if not p:
+            continue
+        try:
+            Path(p).unlink(missing_ok=True)
+        except OSError:
+            logger.debug("Failed to delete temp file %s", p, exc_info=True)
+
+
+async def _save_transcript_output(transcript: str, filename_base: str) -> Optional[str]:
+    """Upload the transcript to the outputs bucket; returns its s3 URI (non-fatal on failure)."""
+    if not transcript:
+        return None
+    try:
+        saved = await to_thread.run_sync(partial(
+            save_transcript_and_summary,
+            transcript=transcript,
+            summary="",
+            filename_base=filename_base,
+        ))
+        return saved.get("transcript_s3")
+    except Exception:
+        logger.exception("Failed to save transcript to outputs (non-fatal)")
+        return None
+
+
+async def _do_transcribe(transcription_id: int, audio: str, cleanup: Tuple[Optional[str], ...] = ()) -> None:
+    """Background job: transcribe `audio` (local path or s3:// URI) into an existing stub row."""
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    provider_text = ""
+    try:
+        result = await to_thread.run_sync(partial(transcribe_audio, audio, upload_only=False))
+    except Exception as e:
+        logger.exception("Background transcription failed for %s", transcription_id)
+        error = str(e)
+    finally:
+        _remove_temp_files(*cleanup)
+
+    async with SessionLocal() as db:
+        t = await db.get(Transcription, transcription_id)
+        if t is None:
+            logger.warning("Transcription %s disappeared before background transcription finished", transcription_id)
+            return
+        if error is not None or not isinstance(result, dict):
+            t.status = STATUS_FAILED
+            t.error = error or "transcribe_audio returned no result"
+        else:
+            s3_uri = result.get("s3_uri")
+            provider_text = result.get("text") or ""
+            t.transcript = provider_text or t.transcript or (f"Uploaded to {s3_uri}" if s3_uri else "")
+            t.speakers = result.get("speakers") or []
+            t.status = STATUS_COMPLETED
+            t.error = None
+        await db.commit()
+
+    # the "Uploaded to ..." placeholder is not a transcript; only real provider text goes to outputs
+    if t.status == STATUS_COMPLETED and provider_text:
+        await _save_transcript_output(provider_text, t.filename or f"meeting_{t.id}")
+
+
+async def _do_summarize(transcription_id: int, language: str, temperature: float) -> None:
+    """Background job: summarize a row and upload transcript+summary to outputs."""
+    # read what we need and release the connection before the (slow) LLM call
+    async with SessionLocal() as db:
+        t = await db.get(Transcription, transcription_id)
+        if t is None:
+            return
+        transcript, speakers, filename_base = t.transcript, t.speakers, t.filename or f"meeting_{t.id}"
+
+    summary: Optional[str] = None
+    summary_s3: Optional[str] = None
+    error: Optional[str] = None
+    try:
+        speaker_table = None
+        if speakers:
+            try:
+                speaker_table = [[s.get("speaker", "Unknown"), s.get("description", "")] for s in speakers]
+            except Exception:
+                logger.warning("Could not read speakers for %s", transcription_id)
+
+        summary = await to_thread.run_sync(
+            partial(summarize_meeting, transcript, speaker_table=speaker_table, system_prompt_language=language, temperature=temperature)
+        )
+
+        # Save transcript+summary to outputs (deterministic)
+        try:
+            saved = await to_thread.run_sync(partial(
+                save_transcript_and_summary,
+                transcript=transcript or "",
+                summary=summary or "",
+                filename_base=filename_base,
+            ))
+            summary_s3 = saved.get("summary_s3")
+        except Exception:
+            logger.exception("Failed to save transcript+summary to outputs (non-fatal)")
+    except Exception as e:
+        logger.exception("Error creating summary for %s", transcription_id)
+        error = str(e)
+
+    async with SessionLocal() as db:
+        t = await db.get(Transcription, transcription_id)
+        if t is None:
+            return
+        # summary state is kept apart from status so a failed summary doesn't fail the transcript
+        if error is not None:
+            t.summary_status = STATUS_FAILED
+            t.summary_error = error
+        else:
+            t.summary = summary
+            # remember where the summary went so /export doesn't upload it again
+            t.summary_s3 = summary_s3
+            t.summary_status = STATUS_COMPLETED
+            t.summary_error = None
+        await db.commit()
+
+
 @app.get("/")
 async def root():
     return {"message": "minutes API", "version": app.version}
 
 
 # --- Upload endpoint --------------------------------------------------------
-@app.post("/upload")
+@app.post("/upload", deprecated=True)
 async def upload_audio(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     transcribe: bool = Query(True, description="If true, run transcription after upload (requires provider configured)"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Accept file upload, convert to mp3 if needed, upload to input S3 (default) and optionally run transcription.
     After creating DB record, save transcript+summary to output bucket (deterministic paths).
+    With transcribe=True the work runs in the background: returns 202 {"id", "status": "processing"}
+    and the client polls GET /transcription/{id} until status is "completed" or "failed".
+
+    Deprecated: proxies the full file body through the API before re-uploading it to S3.
+    Prefer /s3/presign -> direct browser upload to S3 -> /s3/trigger.
     """
     tmp_path: Optional[str] = None
     mp3_path: Optional[str] = None
     upload_result: Optional[dict] = None
 
     try:
-        # limit upload (configurable via env)
-        MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE_BYTES", 100 * 1024 * 1024))  # 100MB default
-        content = await file.read()
-        if len(content) > MAX_FILE_SIZE:
-            raise HTTPException(status_code=413, detail=f"File too large. Max {MAX_FILE_SIZE} bytes.")
-
-        # write to temp file
+        # stream to temp file in 1MB chunks; abort as soon as the limit is exceeded
         with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{file.filename}") as fh:
-            fh.write(content)
             tmp_path = fh.name
-        logger.info("Saved upload to temporary file: %s", tmp_path)
+            total = 0
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                total += len(chunk)
+                if total > MAX_FILE_SIZE:
+                    raise HTTPException(status_code=413, detail=f"File too large. Max {MAX_FILE_SIZE} bytes.")
+                fh.write(chunk)
+        logger.info("Saved upload to temporary file: %s (%d bytes)", tmp_path, total)
 
         # convert (or shortcut if already mp3)
         try:
-            mp3_path = convert_to_mp3(tmp_path)
+            mp3_path = await to_thread.run_sync(convert_to_mp3, tmp_path)
             logger.info("convert_to_mp3 returned: %s", mp3_path)
         except Exception as ex:
             logger.exception("convert_to_mp3 failed")
             raise HTTPException(status_code=500, detail=f"convert_to_mp3 failed: {ex}")
 
-        if not mp3_path or not Path(mp3_path).exists():
+        # convert_to_mp3 raises if ffmpeg produced nothing, so no extra stat() here
+        if not mp3_path:
             raise HTTPException(status_code=500, detail="MP3 conversion failed: file missing")
 
-        # Call services.transcribe_audio:
-        # upload_only = not transcribe
+        if transcribe:
+            # transcription takes tens of seconds: persist a stub row, hand the files to a
+            # background task and let the client poll GET /transcription/{id}
+            transcription = Transcription(filename=file.filename, transcript="", speakers=[], status=STATUS_PROCESSING)
+            db.add(transcription)
+            await db.commit()
+            background_tasks.add_task(_do_transcribe, transcription.id, mp3_path, cleanup=(tmp_path, mp3_path))
+            tmp_path = mp3_path = None  # owned by the background task now
+            return ORJSONResponse(status_code=202, content={"id": transcription.id, "status": STATUS_PROCESSING})
+
+        # Call services.transcribe_audio (upload only)
         try:
-            upload_result = transcribe_audio(mp3_path, upload_only=not transcribe)
-            logger.info(
-                "transcribe_audio returned keys: %s",
-                list(upload_result.keys()) if isinstance(upload_result, dict) else str(upload_result),
-            )
+            upload_result = await to_thread.run_sync(partial(transcribe_audio, mp3_path, upload_only=True))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "transcribe_audio returned keys: %s",
+                    list(upload_result.keys()) if isinstance(upload_result, dict) else type(upload_result).__name__,
+                )
         except TypeError:
             logger.exception("transcribe_audio interface mismatch (upload_only flag missing)")
             raise HTTPException(status_code=500, detail="transcribe_audio interface mismatch (expecting upload_only flag)")
@@ -143,39 +380,32 @@ async def upload_audio(
             provider_raw = upload_result.get("provider_raw")
             # sanitize upload_result for returning to client
             upload_meta = _safe(upload_result)
-            # provider_raw may be nested inside upload_meta already; but ensure it's safe string too
-            if "provider_raw" in upload_meta:
-                upload_meta["provider_raw"] = _safe(upload_meta["provider_raw"])
         else:
             # fallback shape
             upload_meta = _safe(upload_result)
 
-        transcript_text = transcript_text or (f"Uploaded to {s3_uri}" if s3_uri else "")
-        provider_raw_sanitized = _safe(provider_raw)
+        provider_text = transcript_text or ""
+        transcript_text = provider_text or (f"Uploaded to {s3_uri}" if s3_uri else "")
+        # provider_raw is already sanitized as part of upload_meta; avoid a second pass
+        if isinstance(upload_meta, dict):
+            provider_raw_sanitized = upload_meta.get("provider_raw")
+        else:
+            provider_raw_sanitized = _safe(provider_raw)
 
         # Persist DB record
         transcription = Transcription(
             filename=file.filename,
             transcript=transcript_text,
-            speakers=json.dumps(speakers),
+            speakers=speakers,
+            status=STATUS_COMPLETED,
         )
         db.add(transcription)
-        db.commit()
-        db.refresh(transcription)
+        await db.commit()
 
-        # Save transcript and (empty) summary to outputs: deterministic paths
-        try:
-            saved = save_transcript_and_summary(
-                transcript=transcription.transcript or "",
-                summary=transcription.summary or "",
-                filename_base=transcription.filename or f"meeting_{transcription.id}",
-            )
-            transcript_s3 = saved.get("transcript_s3")
-            summary_s3 = saved.get("summary_s3")
-        except Exception:
-            logger.exception("Failed to save transcript/summary to outputs (non-fatal)")
-            transcript_s3 = None
-            summary_s3 = None
+        # Save transcript to outputs (summary is uploaded later by /summarize); the upload placeholder is skipped
+        transcript_s3 = await _save_transcript_output(
+            provider_text, transcription.filename or f"meeting_{transcription.id}"
+        )
 
         return {
             "id": transcription.id,
@@ -186,7 +416,7 @@ async def upload_audio(
             "upload_meta": upload_meta,
             "provider_raw": provider_raw_sanitized,
             "transcript_s3": transcript_s3,
-            "summary_s3": summary_s3,
+            "summary_s3": None,
         }
 
     except HTTPException:
@@ -196,47 +426,46 @@ async def upload_audio(
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         # best-effort cleanup
-        for p in (tmp_path, mp3_path):
-            try:
-                if p and Path(p).exists():
-                    Path(p).unlink()
-            except Exception:
-                logger.debug("Failed to delete temp file %s", p, exc_info=True)
+        _remove_temp_files(tmp_path, mp3_path)
 
 
 # --- Direct transcript save -----------------------------------------------
 class DirectTranscriptRequest(BaseModel):
     filename: str
     transcript: str
-    speakers: str = "[]"
+    speakers: List[Dict[str, Any]] = []
+
+    @field_validator("speakers", mode="before")
+    @classmethod
+    def _decode_legacy_speakers(cls, v: Any) -> Any:
+        # older clients send the list JSON-encoded as a string; a bad string is a 422, not a 500
+        if isinstance(v, str):
+            try:
+                v = json.loads(v) if v.strip() else []
+            except ValueError:
+                raise ValueError("speakers must be a list or a JSON-encoded list")
+            if not isinstance(v, list):
+                raise ValueError("speakers must be a list or a JSON-encoded list")
+        return v
 
 
 @app.post("/transcript")
-async def save_direct_transcript(request: DirectTranscriptRequest, db: Session = Depends(get_db)):
+async def save_direct_transcript(request: DirectTranscriptRequest, db: AsyncSession = Depends(get_db)):
     """Save user-provided transcript directly to DB."""
     try:
         transcription = Transcription(
             filename=request.filename,
             transcript=request.transcript,
             speakers=request.speakers,
+            status=STATUS_COMPLETED,
         )
         db.add(transcription)
-        db.commit()
-        db.refresh(transcription)
+        await db.commit()
 
-        # Save transcript+no-summary to outputs
-        try:
-            saved = save_transcript_and_summary(
-                transcript=transcription.transcript or "",
-                summary=transcription.summary or "",
-                filename_base=transcription.filename or f"meeting_{transcription.id}",
-            )
-            transcript_s3 = saved.get("transcript_s3")
-            summary_s3 = saved.get("summary_s3")
-        except Exception:
-            logger.exception("Failed to save direct transcript to outputs (non-fatal)")
-            transcript_s3 = None
-            summary_s3 = None
+        # Save transcript to outputs (summary is uploaded later by /summarize)
+        transcript_s3 = await _save_transcript_output(
+            transcription.transcript, transcription.filename or f"meeting_{transcription.id}"
+        )
 
         return {
             "id": transcription.id,
@@ -245,7 +474,7 @@ async def save_direct_transcript(request: DirectTranscriptRequest, db: Session =
             "speakers": transcription.speakers,
             "created_at": transcription.created_at,
             "transcript_s3": transcript_s3,
-            "summary_s3": summary_s3,
+            "summary_s3": None,
         }
     except Exception as e:
         logger.exception("Error saving direct transcript")
@@ -254,8 +483,8 @@ async def save_direct_transcript(request: DirectTranscriptRequest, db: Session =
 
 # --- Read, summarize and export --------------------------------------------
 @app.get("/transcription/{transcription_id}")
-async def get_transcription(transcription_id: int, db: Session = Depends(get_db)):
-    t = db.query(Transcription).filter(Transcription.id == transcription_id).first()
+async def get_transcription(transcription_id: int, db: AsyncSession = Depends(get_db)):
+    t = await db.get(Transcription, transcription_id)
     if not t:
         raise HTTPException(status_code=404, detail="Transcription not found")
     return {
@@ -264,70 +493,69 @@ async def get_transcription(transcription_id: int, db: Session = Depends(get_db)
         "transcript": t.transcript,
         "speakers": t.speakers,
         "summary": t.summary,
+        "status": t.status or STATUS_COMPLETED,
+        "error": t.error,
+        "summary_status": t.summary_status,
+        "summary_error": t.summary_error,
         "created_at": t.created_at
     }
 
 
-@app.post("/summarize/{transcription_id}")
-async def create_summary(transcription_id: int, language: str = "en", temperature: float = 0.8, db: Session = Depends(get_db)):
-    t = db.query(Transcription).filter(Transcription.id == transcription_id).first()
+@app.post("/summarize/{transcription_id}", status_code=202)
+async def create_summary(
+    transcription_id: int,
+    background_tasks: BackgroundTasks,
+    language: str = "en",
+    temperature: float = 0.8,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Queue summarization and return 202 {"id", "summary_status": "processing"} immediately.
+    Poll GET /transcription/{id}; the summary is there once summary_status is "completed".
+    """
+    t = await db.get(Transcription, transcription_id)
     if not t:
         raise HTTPException(status_code=404, detail="Transcription not found")
+    if t.status == STATUS_PROCESSING:
+        raise HTTPException(status_code=409, detail="Transcription is still being processed")
+    if t.summary_status == STATUS_PROCESSING:
+        raise HTTPException(status_code=409, detail="Summary is already being generated")
 
-    try:
-        speaker_table = None
-        if t.speakers:
-            try:
-                speakers_data = json.loads(t.speakers)
-                speaker_table = [[s.get("speaker", "Unknown"), s.get("description", "")] for s in speakers_data]
-            except Exception:
-                logger.warning("Could not parse speakers JSON for %s", transcription_id)
-
-        summary = summarize_meeting(t.transcript, speaker_table=speaker_table, system_prompt_language=language, temperature=temperature)
-        t.summary = summary
-        db.commit()
-
-        # Save transcript+summary to outputs (deterministic)
-        saved = None
-        try:
-            saved = save_transcript_and_summary(
-                transcript=t.transcript or "",
-                summary=summary or "",
-                filename_base=t.filename or f"meeting_{t.id}",
-            )
-        except Exception:
-            logger.exception("Failed to save transcript+summary to outputs (non-fatal)")
-
-        return {
-            "summary": summary,
-            "transcript_s3": (saved.get("transcript_s3") if saved else None),
-            "summary_s3": (saved.get("summary_s3") if saved else None),
-        }
-    except Exception as e:
-        logger.exception("Error creating summary for %s", transcription_id)
-        raise HTTPException(status_code=500, detail=str(e))
+    t.summary_status = STATUS_PROCESSING
+    t.summary_error = None
+    await db.commit()
+    background_tasks.add_task(_do_summarize, t.id, language, temperature)
+    return {"id": t.id, "summary_status": STATUS_PROCESSING}
 
 
 @app.get("/export/{transcription_id}")
-async def export_markdown(transcription_id: int, db: Session = Depends(get_db)):
-    t = db.query(Transcription).filter(Transcription.id == transcription_id).first()
+async def export_markdown(transcription_id: int, db: AsyncSession = Depends(get_db)):
+    t = await db.get(Transcription, transcription_id)
     if not t:
         raise HTTPException(status_code=404, detail="Transcription not found")
+    if not t.summary:
+        raise HTTPException(status_code=404, detail="No summary available to export")
 
     try:
-        # Prefer returning presigned S3 link if summary already uploaded (or upload now and return s3_uri).
+        # Prefer returning S3 link if summary already uploaded (or upload now and return s3_uri).
+        if t.summary_s3:
+            _, s3_key = t.summary_s3[5:].split("/", 1)
+            return {"s3_uri": t.summary_s3, "s3_key": s3_key, "bucket": OUTPUT_S3_BUCKET}
         try:
             # Attempt to save/upload summary deterministically
-            saved = save_transcript_and_summary(
+            saved = await to_thread.run_sync(partial(
+                save_transcript_and_summary,
                 transcript=t.transcript or "",
                 summary=t.summary or "",
                 filename_base=t.filename or f"meeting_{t.id}",
-            )
+            ))
             s3_uri = saved.get("summary_s3")
             s3_key = None
             if s3_uri and s3_uri.startswith("s3://"):
                 _, s3_key = s3_uri[5:].split("/", 1)
             if s3_uri:
+                t.summary_s3 = s3_uri
+                await db.commit()
                 return {"s3_uri": s3_uri, "s3_key": s3_key, "bucket": OUTPUT_S3_BUCKET}
             else:
                 # fallback: return local file
@@ -337,7 +565,9 @@ async def export_markdown(transcription_id: int, db: Session = Depends(get_db)):
                 raise RuntimeError("No summary available to export")
         except Exception:
             logger.exception("Failed to upload summary during export; trying local-only save")
-            local_save = save_summary_as_markdown(t.transcript or "", t.summary or "", t.filename or f"meeting_{t.id}", upload_to_s3=False, transcription_id=str(t.id))
+            local_save = await to_thread.run_sync(
+                partial(save_summary_as_markdown, t.transcript or "", t.summary or "", t.filename or f"meeting_{t.id}", upload_to_s3=False, transcription_id=str(t.id))
+            )
             local_path = local_save.get("local_path")
             return FileResponse(local_path, media_type="text/markdown", filename=f"{t.filename or f'meeting_{t.id}'}_summary.md")
     except Exception as e:
@@ -354,17 +584,17 @@ class PresignRequest(BaseModel):
 async def presign_upload(req: PresignRequest = Body(...)):
     """
     Return a presigned POST payload for browser direct upload to S3.
+    This is the primary upload path: the client POSTs the file to S3 itself and then
+    calls /s3/trigger with the returned key, so the API never buffers the audio.
     """
     try:
         filename = req.filename
         if not filename or not filename.strip():
             raise HTTPException(status_code=400, detail="filename is required")
 
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        prefix = os.getenv("TRANSFORM_INPUT_PREFIX", "inputs").rstrip("/")
-        key = f"{prefix}/{timestamp}_{os.path.basename(filename)}"
+        key = _input_key(filename)
 
-        presign = generate_presigned_post(key)
+        presign = await to_thread.run_sync(generate_presigned_post, key)
         return {"presign": presign, "key": key, "bucket": TRANSFORM_INPUT_BUCKET}
     except HTTPException:
         raise
@@ -373,6 +603,104 @@ async def presign_upload(req: PresignRequest = Body(...)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/s3/presign-put")
+async def presign_put_upload(req: PresignRequest = Body(...)):
+    """
+    Return a presigned PUT URL: the client uploads the whole file in one request
+    (e.g. `curl -T`) and then calls /s3/trigger with the returned key.
+    """
+    try:
+        filename = req.filename
+        if not filename or not filename.strip():
+            raise HTTPException(status_code=400, detail="filename is required")
+
+        key = _input_key(filename)
+
+        url = await to_thread.run_sync(generate_presigned_put, key)
+        return {"url": url, "key": key, "bucket": TRANSFORM_INPUT_BUCKET}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Failed to generate presigned PUT")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+class MultipartPresignRequest(BaseModel):
+    filename: str
+    part_count: int
+
+
+class MultipartPart(BaseModel):
+    part_number: int
+    etag: str
+
+
+class MultipartCompleteRequest(BaseModel):
+    key: str
+    upload_id: str
+    parts: List[MultipartPart]
+
+
+class MultipartAbortRequest(BaseModel):
+    key: str
+    upload_id: str
+
+
+@app.post("/s3/presign-multipart")
+async def presign_multipart_upload(req: MultipartPresignRequest = Body(...)):
+    """
+    Start an S3 multipart upload and return one presigned PUT URL per part,
+    so large files can be uploaded from the browser in parallel parts.
+    The bucket CORS config must expose the ETag header; the client sends the
+    collected ETags to /s3/complete-multipart and then calls /s3/trigger,
+    or calls /s3/abort-multipart if any part fails.
+    """
+    try:
+        filename = req.filename
+        if not filename or not filename.strip():
+            raise HTTPException(status_code=400, detail="filename is required")
+        if req.part_count < 1 or req.part_count > S3_MAX_MULTIPART_PARTS:
+            raise HTTPException(status_code=400, detail=f"part_count must be between 1 and {S3_MAX_MULTIPART_PARTS}")
+
+        key = _input_key(filename)
+
+        multipart = await to_thread.run_sync(generate_presigned_multipart, key, req.part_count)
+        return {**multipart, "key": key, "bucket": TRANSFORM_INPUT_BUCKET}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Failed to generate presigned multipart upload")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/s3/complete-multipart")
+async def complete_multipart(req: MultipartCompleteRequest = Body(...)):
+    """Complete a browser multipart upload started via /s3/presign-multipart."""
+    try:
+        if not req.parts:
+            raise HTTPException(status_code=400, detail="parts is required")
+        s3_uri = await to_thread.run_sync(
+            complete_multipart_upload, req.key, req.upload_id, [p.model_dump() for p in req.parts]
+        )
+        return {"s3_uri": s3_uri, "key": req.key, "bucket": TRANSFORM_INPUT_BUCKET}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Failed to complete multipart upload")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/s3/abort-multipart")
+async def abort_multipart(req: MultipartAbortRequest = Body(...)):
+    """Abort a failed browser multipart upload so S3 doesn't keep (and bill for) its uploaded parts."""
+    try:
+        await to_thread.run_sync(abort_multipart_upload, req.key, req.upload_id)
+        return {"aborted": True, "key": req.key, "bucket": TRANSFORM_INPUT_BUCKET}
+    except Exception as e:
+        logger.exception("Failed to abort multipart upload")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # --- S3 trigger (client uploaded file) ------------------------------------
 class S3TriggerRequest(BaseModel):
     s3_key: str
@@ -380,11 +708,12 @@ class S3TriggerRequest(BaseModel):
 
 
 @app.post("/s3/trigger")
-async def s3_trigger(req: S3TriggerRequest, db: Session = Depends(get_db)):
+async def s3_trigger(req: S3TriggerRequest, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db)):
     """
     Trigger post-upload processing for an existing object in S3.
     This implementation stores a DB record referencing the S3 object.
-    If req.transcribe is True, attempts to call services.transcribe_audio(s3_uri, upload_only=False).
+    If req.transcribe is True, services.transcribe_audio(s3_uri, upload_only=False) runs in the background
+    and the endpoint returns 202 {"id", "status": "processing"}; poll GET /transcription/{id}.
     Note: your services.transcribe_audio must support S3 URIs for that flow; otherwise this may fail.
     """
     try:
@@ -399,44 +728,27 @@ async def s3_trigger(req: S3TriggerRequest, db: Session = Depends(get_db)):
         logger.info("Received S3 trigger for: %s", s3_uri)
 
         transcript_text = f"Uploaded to {s3_uri}"
-        speakers_json = json.dumps([])
-        upload_meta = {"s3_uri": s3_uri}
-        provider_raw = None
+        filename = os.path.basename(s3_key)
 
         if req.transcribe:
-            try:
-                result = transcribe_audio(s3_uri, upload_only=False)
-                transcript_text = result.get("text") or transcript_text
-                speakers_json = json.dumps(result.get("speakers") or [])
-                upload_meta = _safe(result)
-                provider_raw = _safe(result.get("provider_raw"))
-            except Exception as e:
-                logger.exception("Transcription from S3 failed for %s", s3_uri)
-                raise HTTPException(status_code=500, detail=f"Transcription failed: {e}")
+            # run transcription in the background; client polls GET /transcription/{id}
+            transcription = Transcription(filename=filename, transcript=transcript_text, speakers=[], status=STATUS_PROCESSING)
+            db.add(transcription)
+            await db.commit()
+            background_tasks.add_task(_do_transcribe, transcription.id, s3_uri)
+            return ORJSONResponse(status_code=202, content={"id": transcription.id, "status": STATUS_PROCESSING})
 
-        filename = os.path.basename(s3_key)
         transcription = Transcription(
             filename=filename,
             transcript=transcript_text,
-            speakers=speakers_json
+            speakers=[],
+            status=STATUS_COMPLETED,
         )
         db.add(transcription)
-        db.commit()
-        db.refresh(transcription)
+        await db.commit()
 
-        # Save transcript+summary to outputs (deterministic)
-        try:
-            saved = save_transcript_and_summary(
-                transcript=transcription.transcript or "",
-                summary=transcription.summary or "",
-                filename_base=transcription.filename or f"meeting_{transcription.id}",
-            )
-            transcript_s3 = saved.get("transcript_s3")
-            summary_s3 = saved.get("summary_s3")
-        except Exception:
-            logger.exception("Failed to save transcript/summary to outputs (non-fatal)")
-            transcript_s3 = None
-            summary_s3 = None
+        # nothing was transcribed, only the upload placeholder, so there is no transcript to save to outputs
+        transcript_s3 = None
 
         return {
             "id": transcription.id,
@@ -444,10 +756,10 @@ async def s3_trigger(req: S3TriggerRequest, db: Session = Depends(get_db)):
             "transcript": transcription.transcript,
             "speakers": transcription.speakers,
             "created_at": transcription.created_at,
-            "upload_meta": upload_meta,
-            "provider_raw": provider_raw,
+            "upload_meta": {"s3_uri": s3_uri},
+            "provider_raw": None,
             "transcript_s3": transcript_s3,
-            "summary_s3": summary_s3,
+            "summary_s3": None,
         }
 
     except HTTPException:
@@ -471,7 +783,7 @@ if __name__ == "__main__":
 
     logger.info("🚀 Starting minutes API...")
     try:
-        uvicorn.run(app, host=os.getenv("HOST", "127.0.0.1"), port=int(os.getenv("PORT", 8000)))
+        uvicorn.run(app, host=HOST, port=PORT)
     except KeyboardInterrupt:
         logger.info("🛑 Server stopped by user")
     except Exception as e:
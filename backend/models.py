@@ -1,6 +1,7 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, event, inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from datetime import datetime
 import os
 
@@ -10,31 +11,90 @@ DATA_DIR = os.getenv("DATA_DIR", "/app/data")
 # Ensure data directory exists
 os.makedirs(DATA_DIR, exist_ok=True)
 
-# SQLite database configuration
-DATABASE_URL = f"sqlite:///{DATA_DIR}/database.db"
+# SQLite database configuration (async driver so DB calls don't block the event loop)
+DATABASE_URL = f"sqlite+aiosqlite:///{DATA_DIR}/database.db"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# aiosqlite defaults to NullPool for file databases; use a bounded queue pool instead
+engine = create_async_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False, "timeout": 30},
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+    pool_recycle=3600,
+    pool_pre_ping=True,
+)
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets readers proceed during writes; busy_timeout retries instead of 'database is locked'"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+SessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 Base = declarative_base()
 
+# Transcription.status values for background transcription/summarization
+STATUS_PROCESSING = "processing"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+ORPHANED_JOB_ERROR = "Interrupted by a server restart; please retry"
+
 class Transcription(Base):
     __tablename__ = "transcriptions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    filename = Column(String, index=True)
+    id = Column(Integer, primary_key=True)  # rowid alias; no separate index needed
+    filename = Column(String)
     transcript = Column(Text)
-    speakers = Column(Text)  # JSON string
+    speakers = Column(JSON, default=list)  # list of {"speaker", "description"}
     summary = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    summary_s3 = Column(String, nullable=True)  # s3:// URI of the last uploaded summary
+    status = Column(String, nullable=True)  # processing | completed | failed (NULL = legacy, completed)
+    error = Column(Text, nullable=True)  # failure detail from the last transcription job
+    summary_status = Column(String, nullable=True)  # processing | completed | failed (NULL = never summarized)
+    summary_error = Column(Text, nullable=True)  # failure detail from the last summary job
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)  # supports newest-first listing
+
+def _add_missing_columns(sync_conn):
+    """create_all doesn't alter existing tables; add nullable columns introduced later"""
+    table = Transcription.__table__
+    existing = {c["name"] for c in inspect(sync_conn).get_columns(table.name)}
+    for column in table.columns:
+        if column.name not in existing and column.nullable:
+            col_type = column.type.compile(dialect=sync_conn.dialect)
+            sync_conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}"))
+
+async def _fail_orphaned_jobs(conn):
+    """Background jobs live in process memory; rows still 'processing' at startup lost their job"""
+    table = Transcription.__table__
+    await conn.execute(
+        table.update()
+        .where(table.c.status == STATUS_PROCESSING)
+        .values(status=STATUS_FAILED, error=ORPHANED_JOB_ERROR)
+    )
+    await conn.execute(
+        table.update()
+        .where(table.c.summary_status == STATUS_PROCESSING)
+        .values(summary_status=STATUS_FAILED, summary_error=ORPHANED_JOB_ERROR)
+    )
+
+async def init_db():
+    """Create tables and fail jobs orphaned by a restart (call once at application startup)"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+        await _fail_orphaned_jobs(conn)
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+async def close_db():
+    """Dispose pooled connections (call once at application shutdown)"""
+    await engine.dispose()
 
-def get_db():
+async def get_db():
     """Database dependency"""
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
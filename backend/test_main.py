@@ -0,0 +1,182 @@
+# backend/test_main.py
+"""
+Tests for main.py request handling that don't need a speech/LLM provider or S3.
+
+The database lives in a temp DATA_DIR and every service call main makes is replaced,
+so the tests run without network access.
+"""
+
+import os
+import tempfile
+from datetime import datetime
+
+import pytest
+
+# models.py creates the SQLite file under DATA_DIR at import time
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="bn_test_data_"))
+
+main = pytest.importorskip("main", reason="backend/main.py must be importable (run pytest from backend/)")
+
+
+TestClient = pytest.importorskip("fastapi.testclient", reason="fastapi.testclient is required").TestClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, "convert_to_mp3", lambda path: path)
+    monkeypatch.setattr(main, "save_transcript_and_summary", lambda **kw: {"transcript_s3": None, "summary_s3": None})
+    with TestClient(main.app) as c:
+        yield c
+
+
+def _upload(client) -> int:
+    resp = client.post("/upload", files={"file": ("meeting.wav", b"RIFF" + b"\x00" * 64, "audio/wav")})
+    assert resp.status_code == 202
+    assert resp.json()["status"] == "processing"
+    return resp.json()["id"]
+
+
+# --- _safe --------------------------------------------------------------------
+@pytest.mark.parametrize("value", [None, "text", 3, 2.5, True, [1, "a", None], {"a": [1, {"b": "c"}]}])
+def test_safe_returns_native_values_unchanged(value):
+    assert main._safe(value) is value
+
+
+def test_safe_converts_non_native_values():
+    class Provider:
+        def __str__(self):
+            return "provider-object"
+
+    when = datetime(2024, 1, 2, 3, 4, 5)
+    out = main._safe({"raw": Provider(), "at": when, 1: ("x", b"y"[0])})
+    assert out == {"raw": "provider-object", "at": when.isoformat(), "1": ["x", 121]}
+
+
+# --- background jobs ----------------------------------------------------------
+def test_transcription_job_processing_to_completed(client, monkeypatch):
+    monkeypatch.setattr(
+        main, "transcribe_audio",
+        lambda audio, upload_only=False: {"s3_uri": "s3://in/k", "text": "hello", "speakers": [{"speaker": "A"}]},
+    )
+    tid = _upload(client)
+
+    # TestClient runs background tasks before returning the response
+    data = client.get(f"/transcription/{tid}").json()
+    assert data["status"] == "completed"
+    assert data["error"] is None
+    assert data["transcript"] == "hello"
+    assert data["speakers"] == [{"speaker": "A"}]
+
+
+def test_transcription_job_processing_to_failed(client, monkeypatch):
+    def boom(audio, upload_only=False):
+        raise RuntimeError("provider down")
+
+    monkeypatch.setattr(main, "transcribe_audio", boom)
+    tid = _upload(client)
+
+    data = client.get(f"/transcription/{tid}").json()
+    assert data["status"] == "failed"
+    assert "provider down" in data["error"]
+
+
+def test_summary_job_state_is_separate_from_transcription_status(client, monkeypatch):
+    monkeypatch.setattr(main, "transcribe_audio", lambda audio, upload_only=False: {"s3_uri": "s3://in/k", "text": "hello"})
+    tid = _upload(client)
+
+    def boom(transcript, **kw):
+        raise RuntimeError("llm down")
+
+    monkeypatch.setattr(main, "summarize_meeting", boom)
+    resp = client.post(f"/summarize/{tid}")
+    assert resp.status_code == 202
+    assert resp.json()["summary_status"] == "processing"
+    data = client.get(f"/transcription/{tid}").json()
+    assert data["status"] == "completed"
+    assert data["summary_status"] == "failed"
+    assert "llm down" in data["summary_error"]
+
+    # a failed summary can be retried
+    monkeypatch.setattr(main, "summarize_meeting", lambda transcript, **kw: "SUMMARY " + transcript)
+    assert client.post(f"/summarize/{tid}").status_code == 202
+    data = client.get(f"/transcription/{tid}").json()
+    assert (data["status"], data["summary_status"], data["summary_error"]) == ("completed", "completed", None)
+    assert data["summary"] == "SUMMARY hello"
+
+
+def test_orphaned_jobs_fail_on_startup(client):
+    async def _insert():
+        async with main.SessionLocal() as db:
+            row = main.Transcription(filename="x.wav", transcript="", status=main.STATUS_PROCESSING, summary_status=main.STATUS_PROCESSING)
+            db.add(row)
+            await db.commit()
+            return row.id
+
+    tid = client.portal.call(_insert)
+    client.portal.call(main.init_db)
+
+    data = client.get(f"/transcription/{tid}").json()
+    assert data["status"] == "failed"
+    assert data["summary_status"] == "failed"
+    assert data["error"] and data["summary_error"]
+    # no longer stuck behind a 409
+    assert client.post(f"/summarize/{tid}").status_code == 202
+
+
+# --- MaxBodySizeMiddleware ----------------------------------------------------
+def test_max_body_size_middleware_returns_413():
+    reached = []
+
+    async def inner(scope, receive, send):
+        reached.append(scope["path"])
+        await main.ORJSONResponse({"ok": True})(scope, receive, send)
+
+    small = TestClient(main.MaxBodySizeMiddleware(inner, max_body_size=10))
+
+    resp = small.post("/upload", content=b"x" * 11)
+    assert resp.status_code == 413
+    assert "too large" in resp.json()["detail"]
+    assert reached == []
+
+    assert small.post("/upload", content=b"x" * 10).status_code == 200
+    assert reached == ["/upload"]
+
+
+# --- /s3/abort-multipart -------------------------------------------------------
+def test_abort_multipart_forwards_key_and_upload_id(client, monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "abort_multipart_upload", lambda key, upload_id: calls.append((key, upload_id)))
+
+    resp = client.post("/s3/abort-multipart", json={"key": "uploads/a.mp3", "upload_id": "u-1"})
+
+    assert resp.status_code == 200
+    assert resp.json()["aborted"] is True
+    assert calls == [("uploads/a.mp3", "u-1")]
+
+
+def test_abort_multipart_reports_s3_errors(client, monkeypatch):
+    def failing_abort(key, upload_id):
+        raise RuntimeError("Multipart abort failed: AccessDenied")
+
+    monkeypatch.setattr(main, "abort_multipart_upload", failing_abort)
+
+    resp = client.post("/s3/abort-multipart", json={"key": "uploads/a.mp3", "upload_id": "u-1"})
+    assert resp.status_code == 500
+    assert "AccessDenied" in resp.json()["detail"]
+
+
+# --- /transcript --------------------------------------------------------------
+@pytest.mark.parametrize(
+    "speakers,expected",
+    [([{"speaker": "A"}], [{"speaker": "A"}]), ('[{"speaker": "B"}]', [{"speaker": "B"}]), ("", [])],
+)
+def test_direct_transcript_accepts_list_or_legacy_string(client, speakers, expected):
+    resp = client.post("/transcript", json={"filename": "f", "transcript": "t", "speakers": speakers})
+    assert resp.status_code == 200
+    assert resp.json()["speakers"] == expected
+
+
+@pytest.mark.parametrize("speakers", ["not json", '{"speaker": "A"}', "5", 5])
+def test_direct_transcript_rejects_bad_speakers_with_422(client, speakers):
+    resp = client.post("/transcript", json={"filename": "f", "transcript": "t", "speakers": speakers})
+    assert resp.status_code == 422
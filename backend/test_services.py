@@ -0,0 +1,309 @@
+# backend/test_services.py
+"""
+Unit tests for services.py helpers that run without ffmpeg, network access or provider keys.
+
+Provider clients are replaced with in-process fakes (or an httpx MockTransport) and audio is
+generated on the fly.
+"""
+
+import asyncio
+import io
+import json
+import os
+import struct
+import types
+import wave
+
+import httpx
+import pytest
+from botocore.exceptions import ClientError
+from openai import OpenAI
+
+services = pytest.importorskip("services", reason="backend/services.py must be importable (run pytest from backend/)")
+
+
+# --- concurrent chunk transcription -------------------------------------------
+class _FakeTranscriptions:
+    """Async stand-in for AsyncOpenAI().audio.transcriptions; later chunks finish first."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, model, file, language=None):
+        name = os.path.basename(file.name if hasattr(file, "name") else file[0])
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.05 / (1 + int(name.rsplit("_", 1)[-1].split(".")[0])))
+            if name in self.fail:
+                raise RuntimeError(f"rejected {name}")
+            return types.SimpleNamespace(text=f"text of {name}")
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def fake_async_openai(monkeypatch):
+    transcriptions = _FakeTranscriptions(fail={"meeting_chunk_002.wav"})
+
+    class _Client:
+        def __init__(self, **kwargs):
+            self.audio = types.SimpleNamespace(transcriptions=transcriptions)
+
+        async def close(self):
+            pass
+
+    monkeypatch.setattr(services, "AsyncOpenAI", _Client)
+    monkeypatch.setattr(services, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(services, "OPENAI_CONCURRENCY", 2)
+    return transcriptions
+
+
+def _chunk_files(tmp_path, n: int):
+    paths = []
+    for i in range(n):
+        path = tmp_path / f"meeting_chunk_{i:03d}.wav"
+        path.write_bytes(b"chunk %d" % i)
+        paths.append(str(path))
+    return paths
+
+
+def test_chunk_results_keep_input_order_and_isolate_failures(tmp_path, fake_async_openai):
+    results = services.transcribe_chunks_with_openai(_chunk_files(tmp_path, 5), language="en")
+
+    assert len(results) == 5
+    for i, res in enumerate(results):
+        if i == 2:
+            assert isinstance(res, RuntimeError)
+            assert "meeting_chunk_002.wav" in str(res)
+        else:
+            assert res["text"] == f"text of meeting_chunk_{i:03d}.wav"
+    assert fake_async_openai.max_in_flight <= 2
+
+
+def test_chunk_read_error_keeps_finished_chunks(tmp_path, fake_async_openai):
+    def segments():
+        yield "meeting_chunk_000.wav", b"audio 0"
+        yield "meeting_chunk_001.wav", b"audio 1"
+        raise OSError("truncated wav")
+
+    results = services.transcribe_chunks_with_openai(segments())
+
+    assert [r["text"] for r in results[:2]] == ["text of meeting_chunk_000.wav", "text of meeting_chunk_001.wav"]
+    assert isinstance(results[2], OSError)
+    assert fake_async_openai.in_flight == 0
+
+
+# --- WAV segmentation ---------------------------------------------------------
+def _write_wav(path, n_frames: int, sample_rate: int = 16000, channels: int = 1, sampwidth: int = 2) -> None:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(sampwidth)
+        w.setframerate(sample_rate)
+        w.writeframes(b"\x01\x00" * (n_frames * channels * sampwidth // 2))
+
+
+@pytest.mark.parametrize("n_frames,max_bytes", [(16000, 8044), (16001, 8044), (1000, 1_000_000), (5, 46)])
+def test_iter_wav_segments_sizes_and_total_frames(tmp_path, n_frames, max_bytes):
+    src = tmp_path / "meeting.wav"
+    _write_wav(src, n_frames)
+
+    segments = list(services.iter_wav_segments(str(src), max_bytes=max_bytes))
+
+    total = 0
+    for idx, (name, data) in enumerate(segments):
+        assert name == f"meeting_chunk_{idx:03d}.wav"
+        assert len(data) <= max_bytes
+        with wave.open(io.BytesIO(data), "rb") as seg:
+            assert (seg.getnchannels(), seg.getsampwidth(), seg.getframerate()) == (1, 2, 16000)
+            total += seg.getnframes()
+    assert total == n_frames
+    # every segment but the last is full
+    frames_per_segment = (max_bytes - 44) // 2
+    assert len(segments) == -(-n_frames // frames_per_segment)
+
+
+def test_iter_wav_segments_rejects_non_pcm_eagerly(tmp_path):
+    bad = tmp_path / "bad.wav"
+    bad.write_bytes(b"not a wav file at all")
+    # raised by the call itself, before any segment is requested
+    with pytest.raises((wave.Error, EOFError)):
+        services.iter_wav_segments(str(bad), max_bytes=1000)
+
+
+@pytest.mark.parametrize(
+    "sample_rate,channels,sampwidth,expected",
+    [(16000, 1, 2, 32000), (44100, 2, 2, 176400), (8000, 1, 1, 8000)],
+)
+def test_wav_header_bps_reads_byte_rate(tmp_path, sample_rate, channels, sampwidth, expected):
+    path = tmp_path / "a.wav"
+    _write_wav(path, 10, sample_rate=sample_rate, channels=channels, sampwidth=sampwidth)
+    assert services._wav_header_bps(str(path)) == expected
+
+
+def test_wav_header_bps_unreadable_inputs(tmp_path):
+    assert services._wav_header_bps(str(tmp_path / "missing.wav")) is None
+
+    short = tmp_path / "short.wav"
+    short.write_bytes(b"RIFF")
+    assert services._wav_header_bps(str(short)) is None
+
+    mp3 = tmp_path / "a.mp3"
+    mp3.write_bytes(b"ID3" + b"\x00" * 64)
+    assert services._wav_header_bps(str(mp3)) is None
+
+    # a zero byte rate is reported as unknown rather than 0
+    zero = tmp_path / "zero.wav"
+    zero.write_bytes(b"RIFF" + struct.pack("<I", 36) + b"WAVEfmt " + struct.pack("<IHHIIHH", 16, 1, 1, 0, 0, 2, 16))
+    assert services._wav_header_bps(str(zero)) is None
+
+
+# --- Batch API summarization --------------------------------------------------
+def _batch_line(idx: int, content: str) -> str:
+    return json.dumps({"custom_id": str(idx), "response": {"body": {"choices": [{"message": {"content": content}}]}}})
+
+
+def test_batch_rows_skips_blank_and_malformed_lines():
+    text = "\n".join(["", _batch_line(0, "a"), "{not json", json.dumps({"no_id": 1}), json.dumps({"custom_id": "x"}), _batch_line(3, "b")])
+    assert [row["custom_id"] for row in services._batch_rows(text)] == ["0", "3"]
+
+
+def _batch_client(output, errors, final_status="completed"):
+    """A real OpenAI client whose HTTP layer serves one batch job from memory."""
+    statuses = ["in_progress", final_status]
+    seen = []
+
+    def handler(request):
+        path = request.url.path
+        seen.append((request.method, path))
+        if path.endswith("/files"):
+            return httpx.Response(200, json={"id": "file-in", "object": "file", "bytes": 1, "created_at": 0, "filename": "summaries.jsonl", "purpose": "batch", "status": "uploaded"})
+        if path.endswith("/batches"):
+            body = json.loads(request.content)
+            assert body == {"input_file_id": "file-in", "endpoint": "/v1/chat/completions", "completion_window": "24h"}
+            return httpx.Response(200, json={"id": "batch-1", "status": "validating"})
+        if path.endswith("/batches/batch-1"):
+            return httpx.Response(200, json={
+                "id": "batch-1",
+                "status": statuses.pop(0),
+                "output_file_id": "file-out" if output is not None else None,
+                "error_file_id": "file-err" if errors is not None else None,
+            })
+        if path.endswith("/files/file-out/content"):
+            return httpx.Response(200, content=output.encode("utf-8"))
+        if path.endswith("/files/file-err/content"):
+            return httpx.Response(200, content=errors.encode("utf-8"))
+        return httpx.Response(404, json={"error": {"message": path}})
+
+    client = OpenAI(api_key="test-key", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    return client, seen
+
+
+def test_summarize_meetings_batch_maps_results_by_custom_id(monkeypatch):
+    # custom_ids index the input list; empty transcripts never reach the API
+    output = "\n".join([_batch_line(3, " S3 "), "{truncated", _batch_line(0, "S0")]) + "\n"
+    client, seen = _batch_client(output, json.dumps({"custom_id": "2", "error": {"message": "boom"}}))
+    monkeypatch.setattr(services, "client", client)
+
+    results = services.summarize_meetings_batch(["a", "", "b", "c"], poll_interval=0)
+
+    failed = "(Summary generation failed or produced empty result)"
+    assert results == ["S0", "No transcript available to summarize.", failed, "S3"]
+    assert ("POST", "/v1/batches") in seen
+
+
+def test_summarize_meetings_batch_all_failed_returns_placeholders(monkeypatch):
+    client, _ = _batch_client(None, json.dumps({"custom_id": "0", "error": {"message": "boom"}}) + "\n")
+    monkeypatch.setattr(services, "client", client)
+
+    assert services.summarize_meetings_batch(["a"], poll_interval=0) == ["(Summary generation failed or produced empty result)"]
+
+
+def test_summarize_meetings_batch_raises_when_the_batch_fails(monkeypatch):
+    client, _ = _batch_client(None, None, final_status="failed")
+    monkeypatch.setattr(services, "client", client)
+
+    with pytest.raises(RuntimeError, match="failed"):
+        services.summarize_meetings_batch(["a"], poll_interval=0)
+
+
+# --- chunk transcription cache ------------------------------------------------
+def test_stt_cache_hit_and_miss(tmp_path, fake_async_openai, monkeypatch):
+    monkeypatch.setattr(services, "STT_CACHE_ENABLED", True)
+    monkeypatch.setattr(services, "_STT_CACHE_DIR", tmp_path / "stt_cache")
+    segments = [(f"meeting_chunk_{i:03d}.wav", b"audio %d" % i) for i in (0, 1)]
+
+    first = services.transcribe_chunks_with_openai(segments, language="en")
+    assert fake_async_openai.calls == 2
+
+    # same bytes and language: served from disk without calling the provider
+    second = services.transcribe_chunks_with_openai(segments, language="en")
+    assert fake_async_openai.calls == 2
+    assert second == first
+    assert (tmp_path / "stt_cache").stat().st_mode & 0o777 == 0o700
+
+    # a different language is a different key
+    services.transcribe_chunks_with_openai(segments[:1], language="de")
+    assert fake_async_openai.calls == 3
+
+    # a failed chunk is not cached
+    failing = [("meeting_chunk_002.wav", b"audio 2"), ("meeting_chunk_003.wav", b"audio 3")]
+    assert isinstance(services.transcribe_chunks_with_openai(failing)[0], RuntimeError)
+    assert isinstance(services.transcribe_chunks_with_openai(failing)[0], RuntimeError)
+    assert fake_async_openai.calls == 6
+
+
+# --- transcribe_audio ---------------------------------------------------------
+def test_input_upload_failure_surfaces_after_provider_success(tmp_path, monkeypatch):
+    audio = tmp_path / "meeting.mp3"
+    audio.write_bytes(b"mp3")
+    calls = []
+    monkeypatch.setattr(services, "convert_to_mp3", lambda path, *a, **kw: path)
+    monkeypatch.setattr(services, "ASSEMBLYAI_API_KEY", "test-key")
+    monkeypatch.setattr(services, "_aai", lambda: object())
+    monkeypatch.setattr(services, "transcribe_with_assemblyai", lambda *a, **kw: calls.append("assemblyai") or {"text": "hi", "speakers": []})
+    monkeypatch.setattr(services, "transcribe_chunks_with_openai", lambda *a, **kw: calls.append("openai") or [])
+
+    def failing_upload(path, key, bucket=None):
+        raise OSError("s3 down")
+
+    monkeypatch.setattr(services, "upload_file_to_s3", failing_upload)
+
+    with pytest.raises(RuntimeError, match="s3 down"):
+        services.transcribe_audio(str(audio), upload_only=False)
+    # the upload error is not mistaken for a provider failure, so nothing is re-transcribed
+    assert calls == ["assemblyai"]
+    assert audio.exists()
+
+
+# --- S3 multipart -------------------------------------------------------------
+class _FakeS3:
+    def __init__(self, error_code=None):
+        self.error_code = error_code
+        self.aborted = []
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        if self.error_code:
+            raise ClientError({"Error": {"Code": self.error_code, "Message": "x"}}, "AbortMultipartUpload")
+        self.aborted.append((Bucket, Key, UploadId))
+
+
+def test_abort_multipart_upload(monkeypatch):
+    s3 = _FakeS3()
+    monkeypatch.setattr(services, "_s3_client", lambda: s3)
+
+    services.abort_multipart_upload("uploads/a.mp3", "u-1", bucket="in")
+    assert s3.aborted == [("in", "uploads/a.mp3", "u-1")]
+
+    # already completed or aborted: nothing left to clean up
+    monkeypatch.setattr(services, "_s3_client", lambda: _FakeS3("NoSuchUpload"))
+    services.abort_multipart_upload("uploads/a.mp3", "u-1", bucket="in")
+
+    monkeypatch.setattr(services, "_s3_client", lambda: _FakeS3("AccessDenied"))
+    with pytest.raises(RuntimeError, match="AccessDenied"):
+        services.abort_multipart_upload("uploads/a.mp3", "u-1", bucket="in")
+
@@ -10,10 +10,90 @@ const api = axios.create({
   },
 })
 
+// Background jobs (/upload, /s3/trigger with transcribe, /summarize) answer 202 with
+// { id, status: 'processing' } (summaries report summary_status instead); poll the record
+// until the job settles. The poll gives up eventually so a lost job can't spin forever.
+const POLL_INTERVAL_MS = 2000
+const POLL_TIMEOUT_MS = 30 * 60 * 1000
+
+const waitForCompletion = async (id, statusField = 'status', errorField = 'error') => {
+  const deadline = Date.now() + POLL_TIMEOUT_MS
+  for (;;) {
+    const { data } = await api.get(`/transcription/${id}`)
+    if (data[statusField] === 'failed') {
+      throw new Error(data[errorField] || 'Processing failed')
+    }
+    if (data[statusField] !== 'processing') {
+      return data
+    }
+    if (Date.now() >= deadline) {
+      throw new Error('Timed out waiting for processing to finish')
+    }
+    await new Promise(resolve => setTimeout(resolve, POLL_INTERVAL_MS))
+  }
+}
+
+const settle = async (response, statusField, errorField) => {
+  if (response.status === 202 && response.data?.id != null) {
+    return waitForCompletion(response.data.id, statusField, errorField)
+  }
+  return response.data
+}
+
+// Files above MULTIPART_THRESHOLD go to S3 as parallel multipart parts. S3 needs parts of
+// at least 5 MiB (except the last) and at most 10000 of them.
+const MULTIPART_THRESHOLD = 100 * 1024 * 1024
+const MULTIPART_PART_SIZE = 16 * 1024 * 1024
+const MULTIPART_MAX_PARTS = 10000
+const MULTIPART_CONCURRENCY = 4
+
+const uploadMultipart = async (file) => {
+  const partSize = Math.max(MULTIPART_PART_SIZE, Math.ceil(file.size / MULTIPART_MAX_PARTS))
+  const partCount = Math.ceil(file.size / partSize)
+  const { data } = await api.post('/s3/presign-multipart', {
+    filename: file.name,
+    part_count: partCount,
+  })
+  const { key, upload_id: uploadId, parts } = data
+
+  try {
+    const etags = new Array(parts.length)
+    let next = 0
+    const worker = async () => {
+      while (next < parts.length) {
+        const i = next++
+        const { part_number: partNumber, url } = parts[i]
+        const resp = await fetch(url, {
+          method: 'PUT',
+          body: file.slice((partNumber - 1) * partSize, partNumber * partSize),
+        })
+        if (!resp.ok) {
+          throw new Error(`S3 part ${partNumber} upload failed: ${resp.statusText}`)
+        }
+        etags[i] = { part_number: partNumber, etag: resp.headers.get('ETag') }
+      }
+    }
+    await Promise.all(Array.from({ length: Math.min(MULTIPART_CONCURRENCY, parts.length) }, worker))
+    await api.post('/s3/complete-multipart', { key, upload_id: uploadId, parts: etags })
+  } catch (err) {
+    // free the parts S3 already stored; the bucket lifecycle rule is the backstop if this fails too
+    await api.post('/s3/abort-multipart', { key, upload_id: uploadId }).catch(abortErr => {
+      console.error('Aborting the multipart upload failed.', abortErr)
+    })
+    throw err
+  }
+  return key
+}
+
 export const transcriptionAPI = {
   // Preferred: Direct upload to S3, then trigger SageMaker transcription
   upload: async (file, onProgress = null) => {
     try {
+      if (file.size > MULTIPART_THRESHOLD) {
+        const key = await uploadMultipart(file)
+        return settle(await api.post('/s3/trigger', { s3_key: key }))
+      }
+
       // 1. Ask backend for presigned POST
       const presignRes = await api.post('/s3/presign', {
         filename: file.name
@@ -42,9 +122,13 @@ export const transcriptionAPI = {
         s3_key: key
       })
 
-      return triggerRes.data
+      return settle(triggerRes)
 
     } catch (err) {
+      // /upload rejects files this large, so there is nothing to fall back to
+      if (file.size > MULTIPART_THRESHOLD) {
+        throw err
+      }
       console.error('Direct S3 upload failed. Falling back to /upload.', err)
 
       // ---- FALLBACK: old /upload route ----
@@ -54,11 +138,11 @@ export const transcriptionAPI = {
       const fallbackResp = await api.post('/upload', fallbackFormData, {
         headers: { 'Content-Type': 'multipart/form-data' }
       })
-      return fallbackResp.data
+      return settle(fallbackResp)
     }
   },
 
-  saveDirectTranscript: async (filename, transcript, speakers = '[]') => {
+  saveDirectTranscript: async (filename, transcript, speakers = []) => {
     const response = await api.post('/transcript', {
       filename,
       transcript,
@@ -76,7 +160,7 @@ export const transcriptionAPI = {
     const response = await api.post(`/summarize/${id}`, null, {
       params: { language, temperature }
     })
-    return response.data
+    return settle(response, 'summary_status', 'summary_error')
   },
 
   export: async (id) => {